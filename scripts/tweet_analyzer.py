@@ -61,6 +61,8 @@ def main():
                       help='Enable verbose logging')
     parser.add_argument('--skip-advanced', action='store_true',
                     help='Skip advanced language analysis (faster, but less insightful)')
+    parser.add_argument('--workers', type=int, default=None,
+                      help='Worker processes for processing/tagging large fetches (default: serial)')
     
     args = parser.parse_args()
     
@@ -107,7 +109,7 @@ def main():
         
         # Step 5: Process tweets
         logger.info("Processing tweets...")
-        processed_tweets = processor.process_tweets(tweets)
+        processed_tweets = processor.process_tweets(tweets, workers=args.workers)
         
         # Step 6: Extract topics
         logger.info("Extracting topics...")
@@ -116,7 +118,7 @@ def main():
         
         # Step 7: Tag tweets
         logger.info("Tagging tweets...")
-        tagged_tweets = processor.tag_tweets(processed_tweets, topics)
+        tagged_tweets = processor.tag_tweets(processed_tweets, topics, workers=args.workers)
         
         # Step 7.5: Perform lightweight language analysis (new)
         if not args.skip_advanced:
@@ -4,16 +4,313 @@ Output Generator - Module for generating output in different formats
 import csv
 import json
 import logging
+import os
 import xml.dom.minidom
 import xml.etree.ElementTree as ET
 import re
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from collections import Counter
 
+try:
+    import orjson  # Optional: serializes large tweet payloads much faster than json
+except ImportError:
+    orjson = None
+
 from .language_analyzer_light import LightweightLanguageAnalyzer
 
+# Summary section headers
+_HDR_DATA_COLLECTION = "\n## DATA COLLECTION"
+_HDR_WRITING_STYLE = "\n## WRITING STYLE ANALYSIS"
+_HDR_READABILITY = "\n## READABILITY ANALYSIS"
+_HDR_EVOLUTION = "\n## WRITING EVOLUTION OVER TIME"
+_HDR_ENGAGEMENT = "\n## ENGAGEMENT PATTERNS"
+_HDR_PERSUASIVE = "\n## PERSUASIVE LANGUAGE PATTERNS"
+_HDR_RECOMMENDATIONS = "\n## WRITING RECOMMENDATIONS"
+
+# Trend metrics shown in the evolution section: (key prefix, display name)
+_TREND_METRICS = (
+    ('sentiment', 'Sentiment'),
+    ('readability', 'Readability'),
+    ('avg_engagement', 'Engagement'),
+)
+
+# Vocabulary groups shown in the recommendations section: (key, display label)
+_VOCAB_GROUPS = (
+    ("key_nouns", "nouns"),
+    ("key_verbs", "verbs"),
+    ("key_adjectives", "adjectives"),
+)
+
+# Writers that emit many small chunks (CSV rows, indented JSON) buffer up to 1 MiB per syscall
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _write_bytes(filename: Path, data: bytes) -> None:
+    """Write an encoded buffer straight to a file descriptor, bypassing Python's I/O stack"""
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            # os.write may write fewer bytes than requested
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Field accessors for vocabulary/emoji entries in the practical insights
+_get_word = itemgetter("word")
+_get_emoji = itemgetter("emoji")
+
+
+def _render_writing_style(style: Dict) -> List[str]:
+    """Render the writing style section of the summary"""
+    lines = [_HDR_WRITING_STYLE]
+    
+    # Voice and formality
+    voice = style.get("voice")
+    formality = style.get("formality")
+    if voice is not None and formality is not None:
+        lines.append("\n### Voice and Tone")
+        lines.append(f"Dominant voice: {voice.get('dominant_voice', 'Neutral')}")
+        
+        # Add voice breakdown
+        lines.append(f"- First person (I, we, me): {voice.get('first_person_ratio', 0)*100:.1f}%")
+        lines.append(f"- Second person (you, your): {voice.get('second_person_ratio', 0)*100:.1f}%")
+        lines.append(f"- Third person (he, she, they): {voice.get('third_person_ratio', 0)*100:.1f}%")
+        
+        # Add formality
+        lines.append(f"\nFormality level: {formality.get('level', 'Neutral')}")
+        lines.append(f"- Formal markers: {formality.get('formal_markers', 0)} instances")
+        lines.append(f"- Informal markers: {formality.get('informal_markers', 0)} instances")
+    
+    # Sentence complexity
+    structure = style.get("sentence_structure")
+    if structure is not None:
+        lines.append("\n### Sentence Structure")
+        lines.append(f"Average sentence length: {structure.get('avg_sentence_length', 0):.1f} words")
+        
+        # Add question and exclamation stats
+        lines.append(f"Question sentences: {structure.get('question_ratio', 0)*100:.1f}% of total")
+        lines.append(f"Exclamatory sentences: {structure.get('exclamation_ratio', 0)*100:.1f}% of total")
+    
+    # Vocabulary richness
+    vocabulary = style.get("vocabulary")
+    if vocabulary is not None:
+        lines.append("\n### Vocabulary")
+        lines.append(f"Vocabulary richness: {vocabulary.get('richness', 0):.3f}")
+        lines.append("(Higher values indicate more diverse vocabulary)")
+        
+        # Add top words
+        top_words = vocabulary.get("top_words")
+        if top_words is not None:
+            lines.append("\nMost frequent significant words:")
+            for word_data in top_words[:10]:
+                lines.append(f"- {word_data['word']}: {word_data['count']} times")
+        
+        # Add top phrases
+        top_phrases = vocabulary.get("top_phrases")
+        if top_phrases is not None:
+            lines.append("\nCharacteristic phrases:")
+            for phrase_data in top_phrases:
+                lines.append(f"- \"{phrase_data['phrase']}\": {phrase_data['count']} times")
+    
+    return lines
+
+
+def _render_readability(readability: Dict) -> List[str]:
+    """Render the readability section of the summary"""
+    lines = [_HDR_READABILITY]
+    
+    scores = readability.get("scores")
+    if scores is not None:
+        lines.append(f"Flesch Reading Ease: {scores.get('flesch_reading_ease', 0):.1f}/100")
+        lines.append(f"Flesch-Kincaid Grade Level: {scores.get('flesch_kincaid_grade', 0):.1f}")
+        
+        # Add interpretation
+        lines.append(f"\nInterpretation: {readability.get('interpretation', 'N/A')}")
+        
+        # Add Twitter optimization insight
+        if readability.get('is_optimal_for_social', False):
+            lines.append("\nThis readability level is optimal for Twitter/social media.")
+        else:
+            lines.append("\nThis readability level may not be optimal for Twitter/social media.")
+        
+        # Add words per tweet
+        lines.append(f"\nAverage words per tweet: {readability.get('avg_words_per_tweet', 0):.1f}")
+        
+        # Add readability insights
+        insights = readability.get("insights")
+        if insights is not None:
+            lines.append("\nReadability insights:")
+            for insight in insights:
+                lines.append(f"- {insight}")
+    
+    return lines
+
+
+def _render_temporal(temporal: Dict) -> List[str]:
+    """Render the writing evolution section of the summary"""
+    evolution_insights = temporal.get("evolution_insights")
+    if not evolution_insights:
+        return []
+    
+    lines = [_HDR_EVOLUTION]
+    lines.append(f"Analysis period: {temporal.get('start_date', 'Unknown')} to {temporal.get('end_date', 'Unknown')}")
+    lines.append(f"Time segmentation: {temporal.get('period_type', 'Unknown')}")
+    
+    # Add key insights
+    lines.append("\nKey trends:")
+    for insight in evolution_insights:
+        lines.append(f"- {insight}")
+    
+    # Add trend metrics
+    trends = temporal.get("trends")
+    if trends is not None:
+        lines.append("\nDetailed Trends:")
+        for metric_key, metric_name in _TREND_METRICS:
+            trend = trends.get(f"{metric_key}_trend")
+            if trend is not None:
+                change = trends.get(f"{metric_key}_change_pct", 0)
+                lines.append(f"- {metric_name}: {trend} ({change:+.1f}%)")
+    
+    return lines
+
+
+def _render_engagement(engagement: Dict) -> List[str]:
+    """Render the engagement patterns section of the summary"""
+    engagement_insights = engagement.get("engagement_insights")
+    if not engagement_insights:
+        return []
+    
+    lines = [_HDR_ENGAGEMENT]
+    
+    # Add key insights
+    lines.append("What drives higher engagement:")
+    for insight in engagement_insights:
+        lines.append(f"- {insight}")
+    
+    # Add high vs low comparison highlights
+    comparison = engagement.get("high_vs_low_comparison")
+    if comparison is not None:
+        lines.append("\nHigh vs. Low Engagement Content Comparison:")
+        
+        # Readability comparison
+        read_comp = comparison.get("readability")
+        if read_comp is not None:
+            diff = read_comp.get("difference", 0)
+            if abs(diff) > 5:
+                if diff > 0:
+                    lines.append("- High-engagement content is more readable")
+                else:
+                    lines.append("- High-engagement content is more complex")
+        
+        # Sentiment comparison
+        sent_comp = comparison.get("sentiment")
+        if sent_comp is not None:
+            diff = sent_comp.get("difference", 0)
+            if abs(diff) > 0.2:
+                if diff > 0:
+                    lines.append("- High-engagement content is more positive")
+                else:
+                    lines.append("- High-engagement content is more critical/negative")
+        
+        # Length comparison
+        len_comp = comparison.get("avg_length")
+        if len_comp is not None:
+            diff = len_comp.get("difference", 0)
+            if abs(diff) > 3:
+                if diff > 0:
+                    lines.append(f"- High-engagement tweets are longer (by {diff:.1f} words)")
+                else:
+                    lines.append(f"- High-engagement tweets are shorter (by {abs(diff):.1f} words)")
+    
+    # Add top tweets
+    top_tweets = engagement.get("top_engaging_tweets")
+    if top_tweets:
+        lines.append("\nMost engaging tweet examples:")
+        for i, tweet in enumerate(top_tweets[:3], 1):
+            lines.append(f"{i}. \"{tweet.get('text', '')}\"")
+            lines.append(f"   Engagement: {tweet.get('engagement', 0)}")
+    
+    return lines
+
+
+def _render_persuasive(persuasive: Dict) -> List[str]:
+    """Render the persuasive language section of the summary"""
+    lines = [_HDR_PERSUASIVE]
+    
+    # Add persuasive style
+    dominant_style = persuasive.get("dominant_style")
+    if dominant_style is not None:
+        lines.append(f"Dominant persuasive style: {dominant_style}")
+    
+    # Add top persuasive markers
+    markers = persuasive.get("top_markers")
+    if markers:
+        lines.append("\nTop persuasive markers:")
+        for marker, count in markers.items():
+            lines.append(f"- '{marker}': {count} instances")
+    
+    # Add other persuasive elements
+    lines.append(f"\nRhetorical questions: {persuasive.get('rhetorical_questions', 0)} instances")
+    lines.append(f"Call-to-action elements: {persuasive.get('calls_to_action', 0)} instances")
+    lines.append(f"Social proof references: {persuasive.get('social_proof_markers', 0)} instances")
+    
+    # Add persuasive insights
+    insights = persuasive.get("insights")
+    if insights is not None:
+        lines.append("\nPersuasive style insights:")
+        for insight in insights:
+            lines.append(f"- {insight}")
+    
+    return lines
+
+
+def _render_practical(practical: Dict) -> List[str]:
+    """Render the writing recommendations section of the summary"""
+    lines = [_HDR_RECOMMENDATIONS]
+    
+    # Add specific recommendations
+    recommendations = practical.get("writing_recommendations")
+    if recommendations is not None:
+        lines.append("To emulate this writing style effectively:")
+        for rec in recommendations:
+            lines.append(f"- {rec}")
+    
+    # Add key vocabulary
+    vocab = practical.get("vocabulary_themes")
+    if vocab is not None:
+        for vocab_key, label in _VOCAB_GROUPS:
+            words = vocab.get(vocab_key)
+            if words:
+                lines.append(f"\nCharacteristic {label} to incorporate:")
+                lines.append(", ".join(map(_get_word, words[:8])))
+    
+    # Add emoji usage if relevant
+    emoji_info = practical.get("emoji_usage")
+    if emoji_info is not None and emoji_info.get("uses_emoji"):
+        top_emojis = emoji_info.get("top_emojis")
+        if top_emojis:
+            lines.append("\nCharacteristic emojis to incorporate:")
+            lines.append(" ".join(map(_get_emoji, top_emojis[:10])))
+    
+    return lines
+
+
+# Summary sections in output order: (advanced analysis key, renderer)
+_SUMMARY_SECTIONS = (
+    ("writing_style", _render_writing_style),
+    ("readability", _render_readability),
+    ("temporal", _render_temporal),
+    ("engagement", _render_engagement),
+    ("persuasive_patterns", _render_persuasive),
+    ("practical_insights", _render_practical),
+)
+
+
 class OutputGenerator:
     """Class for generating output in different formats (CSV, XML)"""
     
@@ -35,8 +332,12 @@ class OutputGenerator:
         try:
             # Save to file
             filename = folder_path / "raw_tweets.json"
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(tweets, f)
+            if orjson is not None:
+                # Encode straight to UTF-8 bytes, skipping the str round-trip
+                _write_bytes(filename, orjson.dumps(tweets))
+            else:
+                with open(filename, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                    json.dump(tweets, f)
             
             self.logger.info(f"Saved raw tweet data to {filename}")
             return str(filename)
@@ -107,7 +408,7 @@ class OutputGenerator:
             ]
         
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
                 
@@ -417,8 +718,7 @@ class OutputGenerator:
             
             # Save to file
             filename = folder_path / "tweets_lean.xml"
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(pretty_xml)
+            _write_bytes(filename, pretty_xml.encode('utf-8'))
             
             self.logger.info(f"Saved {len(tweets)} tweets to lean XML file: {filename}")
             return str(filename)
@@ -445,7 +745,7 @@ class OutputGenerator:
         try:
             # Save to file
             filename = folder_path / "account_info.json"
-            with open(filename, 'w', encoding='utf-8') as f:
+            with open(filename, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
                 json.dump(account_info, f, indent=2)
             
             self.logger.info(f"Saved account info to {filename}")
@@ -495,245 +795,15 @@ class OutputGenerator:
                     summary_lines.append(f"Bio: {account_info.get('description', '')}")
             
             # Add data collection info
-            summary_lines.append(f"\n## DATA COLLECTION")
+            summary_lines.append(_HDR_DATA_COLLECTION)
             summary_lines.append(f"Tweets analyzed: {len(tweets):,}")
             summary_lines.append(f"Analysis date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             
-            # Add writing style analysis
-            if "writing_style" in advanced_analysis:
-                style = advanced_analysis["writing_style"]
-                summary_lines.append(f"\n## WRITING STYLE ANALYSIS")
-                
-                # Voice and formality
-                if "voice" in style and "formality" in style:
-                    voice = style["voice"]
-                    formality = style["formality"]
-                    
-                    summary_lines.append("\n### Voice and Tone")
-                    summary_lines.append(f"Dominant voice: {voice.get('dominant_voice', 'Neutral')}")
-                    
-                    # Add voice breakdown
-                    summary_lines.append(f"- First person (I, we, me): {voice.get('first_person_ratio', 0)*100:.1f}%")
-                    summary_lines.append(f"- Second person (you, your): {voice.get('second_person_ratio', 0)*100:.1f}%")
-                    summary_lines.append(f"- Third person (he, she, they): {voice.get('third_person_ratio', 0)*100:.1f}%")
-                    
-                    # Add formality
-                    summary_lines.append(f"\nFormality level: {formality.get('level', 'Neutral')}")
-                    summary_lines.append(f"- Formal markers: {formality.get('formal_markers', 0)} instances")
-                    summary_lines.append(f"- Informal markers: {formality.get('informal_markers', 0)} instances")
-                
-                # Sentence complexity
-                if "sentence_structure" in style:
-                    structure = style["sentence_structure"]
-                    summary_lines.append("\n### Sentence Structure")
-                    summary_lines.append(f"Average sentence length: {structure.get('avg_sentence_length', 0):.1f} words")
-                    
-                    # Add question and exclamation stats
-                    summary_lines.append(f"Question sentences: {structure.get('question_ratio', 0)*100:.1f}% of total")
-                    summary_lines.append(f"Exclamatory sentences: {structure.get('exclamation_ratio', 0)*100:.1f}% of total")
-                
-                # Vocabulary richness
-                if "vocabulary" in style:
-                    vocabulary = style["vocabulary"]
-                    summary_lines.append("\n### Vocabulary")
-                    summary_lines.append(f"Vocabulary richness: {vocabulary.get('richness', 0):.3f}")
-                    summary_lines.append("(Higher values indicate more diverse vocabulary)")
-                    
-                    # Add top words
-                    if "top_words" in vocabulary:
-                        summary_lines.append("\nMost frequent significant words:")
-                        for word_data in vocabulary["top_words"][:10]:
-                            summary_lines.append(f"- {word_data['word']}: {word_data['count']} times")
-                    
-                    # Add top phrases
-                    if "top_phrases" in vocabulary:
-                        summary_lines.append("\nCharacteristic phrases:")
-                        for phrase_data in vocabulary["top_phrases"]:
-                            summary_lines.append(f"- \"{phrase_data['phrase']}\": {phrase_data['count']} times")
-            
-            # Add readability analysis
-            if "readability" in advanced_analysis:
-                readability = advanced_analysis["readability"]
-                summary_lines.append(f"\n## READABILITY ANALYSIS")
-                
-                if "scores" in readability:
-                    scores = readability["scores"]
-                    summary_lines.append(f"Flesch Reading Ease: {scores.get('flesch_reading_ease', 0):.1f}/100")
-                    summary_lines.append(f"Flesch-Kincaid Grade Level: {scores.get('flesch_kincaid_grade', 0):.1f}")
-                    
-                    # Add interpretation
-                    summary_lines.append(f"\nInterpretation: {readability.get('interpretation', 'N/A')}")
-                    
-                    # Add Twitter optimization insight
-                    is_optimal = readability.get('is_optimal_for_social', False)
-                    if is_optimal:
-                        summary_lines.append("\nThis readability level is optimal for Twitter/social media.")
-                    else:
-                        summary_lines.append("\nThis readability level may not be optimal for Twitter/social media.")
-                    
-                    # Add words per tweet
-                    summary_lines.append(f"\nAverage words per tweet: {readability.get('avg_words_per_tweet', 0):.1f}")
-                    
-                    # Add readability insights
-                    if "insights" in readability:
-                        summary_lines.append("\nReadability insights:")
-                        for insight in readability["insights"]:
-                            summary_lines.append(f"- {insight}")
-            
-            # Add temporal analysis if available
-            if "temporal" in advanced_analysis:
-                temporal = advanced_analysis["temporal"]
-                
-                if temporal.get("evolution_insights"):
-                    summary_lines.append(f"\n## WRITING EVOLUTION OVER TIME")
-                    summary_lines.append(f"Analysis period: {temporal.get('start_date', 'Unknown')} to {temporal.get('end_date', 'Unknown')}")
-                    summary_lines.append(f"Time segmentation: {temporal.get('period_type', 'Unknown')}")
-                    
-                    # Add key insights
-                    summary_lines.append("\nKey trends:")
-                    for insight in temporal.get("evolution_insights", []):
-                        summary_lines.append(f"- {insight}")
-                    
-                    # Add trend metrics
-                    if "trends" in temporal:
-                        trends = temporal["trends"]
-                        metrics_to_show = [
-                            ('sentiment', 'Sentiment'), 
-                            ('readability', 'Readability'),
-                            ('avg_engagement', 'Engagement')
-                        ]
-                        
-                        summary_lines.append("\nDetailed Trends:")
-                        for metric_key, metric_name in metrics_to_show:
-                            if f"{metric_key}_trend" in trends:
-                                trend = trends[f"{metric_key}_trend"]
-                                change = trends.get(f"{metric_key}_change_pct", 0)
-                                summary_lines.append(f"- {metric_name}: {trend} ({change:+.1f}%)")
-            
-            # Add engagement analysis
-            if "engagement" in advanced_analysis:
-                engagement = advanced_analysis["engagement"]
-                
-                if "engagement_insights" in engagement and engagement["engagement_insights"]:
-                    summary_lines.append(f"\n## ENGAGEMENT PATTERNS")
-                    
-                    # Add key insights
-                    summary_lines.append("What drives higher engagement:")
-                    for insight in engagement.get("engagement_insights", []):
-                        summary_lines.append(f"- {insight}")
-                    
-                    # Add high vs low comparison highlights
-                    if "high_vs_low_comparison" in engagement:
-                        comparison = engagement["high_vs_low_comparison"]
-                        
-                        summary_lines.append("\nHigh vs. Low Engagement Content Comparison:")
-                        
-                        # Readability comparison
-                        if "readability" in comparison:
-                            read_comp = comparison["readability"]
-                            diff = read_comp.get("difference", 0)
-                            if abs(diff) > 5:
-                                if diff > 0:
-                                    summary_lines.append("- High-engagement content is more readable")
-                                else:
-                                    summary_lines.append("- High-engagement content is more complex")
-                        
-                        # Sentiment comparison
-                        if "sentiment" in comparison:
-                            sent_comp = comparison["sentiment"]
-                            diff = sent_comp.get("difference", 0)
-                            if abs(diff) > 0.2:
-                                if diff > 0:
-                                    summary_lines.append("- High-engagement content is more positive")
-                                else:
-                                    summary_lines.append("- High-engagement content is more critical/negative")
-                        
-                        # Length comparison
-                        if "avg_length" in comparison:
-                            len_comp = comparison["avg_length"]
-                            diff = len_comp.get("difference", 0)
-                            if abs(diff) > 3:
-                                if diff > 0:
-                                    summary_lines.append(f"- High-engagement tweets are longer (by {diff:.1f} words)")
-                                else:
-                                    summary_lines.append(f"- High-engagement tweets are shorter (by {abs(diff):.1f} words)")
-                    
-                    # Add top tweets
-                    if "top_engaging_tweets" in engagement and engagement["top_engaging_tweets"]:
-                        top_tweets = engagement["top_engaging_tweets"]
-                        summary_lines.append("\nMost engaging tweet examples:")
-                        for i, tweet in enumerate(top_tweets[:3], 1):
-                            summary_lines.append(f"{i}. \"{tweet.get('text', '')}\"")
-                            summary_lines.append(f"   Engagement: {tweet.get('engagement', 0)}")
-            
-            # Add persuasive language analysis
-            if "persuasive_patterns" in advanced_analysis:
-                persuasive = advanced_analysis["persuasive_patterns"]
-                
-                summary_lines.append(f"\n## PERSUASIVE LANGUAGE PATTERNS")
-                
-                # Add persuasive style
-                if "dominant_style" in persuasive:
-                    summary_lines.append(f"Dominant persuasive style: {persuasive.get('dominant_style', 'Mixed')}")
-                
-                # Add top persuasive markers
-                if "top_markers" in persuasive:
-                    markers = persuasive["top_markers"]
-                    if markers:
-                        summary_lines.append("\nTop persuasive markers:")
-                        for marker, count in markers.items():
-                            summary_lines.append(f"- '{marker}': {count} instances")
-                
-                # Add other persuasive elements
-                summary_lines.append(f"\nRhetorical questions: {persuasive.get('rhetorical_questions', 0)} instances")
-                summary_lines.append(f"Call-to-action elements: {persuasive.get('calls_to_action', 0)} instances")
-                summary_lines.append(f"Social proof references: {persuasive.get('social_proof_markers', 0)} instances")
-                
-                # Add persuasive insights
-                if "insights" in persuasive:
-                    summary_lines.append("\nPersuasive style insights:")
-                    for insight in persuasive["insights"]:
-                        summary_lines.append(f"- {insight}")
-            
-            # Add practical insights
-            if "practical_insights" in advanced_analysis:
-                practical = advanced_analysis["practical_insights"]
-                
-                summary_lines.append(f"\n## WRITING RECOMMENDATIONS")
-                
-                # Add specific recommendations
-                if "writing_recommendations" in practical:
-                    recommendations = practical["writing_recommendations"]
-                    summary_lines.append("To emulate this writing style effectively:")
-                    for rec in recommendations:
-                        summary_lines.append(f"- {rec}")
-                
-                # Add key vocabulary
-                if "vocabulary_themes" in practical:
-                    vocab = practical["vocabulary_themes"]
-                    
-                    # Add key nouns
-                    if "key_nouns" in vocab and vocab["key_nouns"]:
-                        summary_lines.append("\nCharacteristic nouns to incorporate:")
-                        summary_lines.append(", ".join(item["word"] for item in vocab["key_nouns"][:8]))
-                    
-                    # Add key verbs
-                    if "key_verbs" in vocab and vocab["key_verbs"]:
-                        summary_lines.append("\nCharacteristic verbs to incorporate:")
-                        summary_lines.append(", ".join(item["word"] for item in vocab["key_verbs"][:8]))
-                    
-                    # Add key adjectives
-                    if "key_adjectives" in vocab and vocab["key_adjectives"]:
-                        summary_lines.append("\nCharacteristic adjectives to incorporate:")
-                        summary_lines.append(", ".join(item["word"] for item in vocab["key_adjectives"][:8]))
-                
-                # Add emoji usage if relevant
-                if "emoji_usage" in practical and practical["emoji_usage"].get("uses_emoji"):
-                    emoji_info = practical["emoji_usage"]
-                    if emoji_info.get("top_emojis"):
-                        summary_lines.append("\nCharacteristic emojis to incorporate:")
-                        emojis = [item["emoji"] for item in emoji_info.get("top_emojis", [])]
-                        summary_lines.append(" ".join(emojis[:10]))
+            # Add each analysis section that is present
+            for key, render in _SUMMARY_SECTIONS:
+                section = advanced_analysis.get(key)
+                if section is not None:
+                    summary_lines.extend(render(section))
             
             # Add footer
             summary_lines.append("\n" + "=" * 80)
@@ -742,8 +812,7 @@ class OutputGenerator:
             
             # Save to file
             filename = folder_path / "writing_style_analysis.txt"
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(summary_lines))
+            _write_bytes(filename, '\n'.join(summary_lines).encode('utf-8'))
             
             self.logger.info(f"Saved advanced writing style analysis to {filename}")
             return str(filename)
@@ -4,8 +4,10 @@ SocialData API Client - Core module for interacting with the SocialData API
 
 import os
 import time
+import threading
 import logging
-import requests
+import httpx
+from functools import lru_cache
 from typing import Dict, List, Optional, Union, Any
 from pathlib import Path
 from dotenv import load_dotenv
@@ -13,30 +15,42 @@ from dotenv import load_dotenv
 class RateLimiter:
     """Handles rate limiting for API requests"""
     
-    def __init__(self, max_calls: int = 30, period: int = 60):
+    def __init__(self, max_calls: int = 30, period: int = 60, min_interval: float = 0.0):
         """
         Initialize rate limiter
         
         Args:
             max_calls: Maximum number of calls allowed in the period
             period: Time period in seconds
+            min_interval: Minimum spacing between consecutive calls in seconds
         """
         self.max_calls = max_calls
         self.period = period
+        self.min_interval = min_interval
         self.calls = []
+        self._lock = threading.Lock()
     
     def wait_if_needed(self):
-        """Wait if rate limit is reached"""
-        now = time.time()
-        self.calls = [call for call in self.calls if call > now - self.period]
-        
-        if len(self.calls) >= self.max_calls:
-            sleep_time = self.calls[0] - (now - self.period)
-            if sleep_time > 0:
-                logging.info(f"Rate limit reached. Waiting {sleep_time:.2f} seconds...")
-                time.sleep(sleep_time)
-        
-        self.calls.append(now)
+        """Wait if rate limit is reached (safe to call from multiple threads)"""
+        with self._lock:
+            now = time.time()
+            self.calls = [call for call in self.calls if call > now - self.period]
+            
+            if len(self.calls) >= self.max_calls:
+                sleep_time = self.calls[0] - (now - self.period)
+                if sleep_time > 0:
+                    logging.info(f"Rate limit reached. Waiting {sleep_time:.2f} seconds...")
+                    time.sleep(sleep_time)
+                    now = time.time()
+            
+            # Enforce minimum spacing between calls, if configured
+            if self.min_interval > 0 and self.calls:
+                sleep_time = self.calls[-1] + self.min_interval - now
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+                    now = time.time()
+            
+            self.calls.append(now)
 
 
 class SocialDataClient:
@@ -45,7 +59,8 @@ class SocialDataClient:
     BASE_URL = "https://api.socialdata.tools"
     
     def __init__(self, api_key: Optional[str] = None, rate_limit_calls: int = 30, 
-                 rate_limit_period: int = 60, retry_attempts: int = 3, retry_delay: int = 5):
+                 rate_limit_period: int = 60, retry_attempts: int = 3, retry_delay: int = 5,
+                 min_request_interval: float = 0.0):
         """
         Initialize the SocialData API client
         
@@ -55,13 +70,22 @@ class SocialDataClient:
             rate_limit_period: Rate limit period in seconds
             retry_attempts: Number of retry attempts for failed requests
             retry_delay: Delay between retry attempts in seconds
+            min_request_interval: Minimum spacing between requests in seconds
         """
         self.api_key = api_key or self._load_api_key()
         self.headers = {
             'Authorization': f'Bearer {self.api_key}',
             'Accept': 'application/json'
         }
-        self.rate_limiter = RateLimiter(rate_limit_calls, rate_limit_period)
+        # Reuse one pooled HTTP/2 client so concurrent calls multiplex over a single connection
+        self.http_client = httpx.Client(
+            http2=True,
+            headers=self.headers,
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        )
+        self.rate_limiter = RateLimiter(rate_limit_calls, rate_limit_period, min_request_interval)
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
         
@@ -81,6 +105,12 @@ class SocialDataClient:
         
         return api_key
     
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _url_for(cls, endpoint: str) -> str:
+        """Build the full URL for an endpoint (cached, endpoints repeat across pages)"""
+        return f"{cls.BASE_URL}/{endpoint.lstrip('/')}"
+    
     def make_request(self, endpoint: str, method: str = "GET", 
                     params: Optional[Dict] = None, json_data: Optional[Dict] = None) -> Dict:
         """
@@ -95,20 +125,16 @@ class SocialDataClient:
         Returns:
             Response data as dictionary
         """
-        url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+        url = self._url_for(endpoint)
         
         for attempt in range(self.retry_attempts):
             try:
                 self.rate_limiter.wait_if_needed()
                 
-                response = requests.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    params=params,
-                    json=json_data,
-                    timeout=30
-                )
+                if method == "GET":
+                    response = self.http_client.get(url, params=params)
+                else:
+                    response = self.http_client.request(method, url, params=params, json=json_data)
                 
                 # Handle HTTP errors
                 if response.status_code == 200:
@@ -125,10 +151,13 @@ class SocialDataClient:
                 else:
                     response.raise_for_status()
                     
-            except requests.Timeout:
+            except httpx.TimeoutException:
                 logging.warning(f"Request timeout (attempt {attempt + 1}/{self.retry_attempts})")
-            except requests.RequestException as e:
+            except httpx.HTTPError as e:
                 logging.error(f"Request failed: {e} (attempt {attempt + 1}/{self.retry_attempts})")
+            except ValueError as e:
+                # Malformed response body (json.JSONDecodeError)
+                logging.error(f"Invalid response: {e} (attempt {attempt + 1}/{self.retry_attempts})")
             
             # If we get here, the request failed and we should retry
             if attempt < self.retry_attempts - 1:
@@ -3,8 +3,10 @@ Tweet Fetcher - Module for fetching tweets using the SocialData API
 """
 
 import logging
+import threading
 import time
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Dict, List, Optional, Callable, Tuple, Any, Set
 from pathlib import Path
 
@@ -13,16 +15,36 @@ from .socialdata_client import SocialDataClient
 class TweetFetcher:
     """Class for fetching tweets with various filtering options"""
     
+    # Client shared by all fetchers created without an explicit client
+    _shared_client: Optional[SocialDataClient] = None
+    _shared_client_lock = threading.Lock()
+    
     def __init__(self, client: Optional[SocialDataClient] = None):
         """
         Initialize the tweet fetcher
         
         Args:
-            client: SocialData API client (if None, a new one will be created)
+            client: SocialData API client (if None, the shared default client is used)
         """
-        self.client = client or SocialDataClient()
+        self.client = client or TweetFetcher.default_client()
         self.logger = logging.getLogger(__name__)
     
+    @classmethod
+    def default_client(cls) -> SocialDataClient:
+        """
+        Get the process-wide SocialData client, creating it on first use
+        
+        Sharing one client keeps rate limiting global (the quota is per API key)
+        and lets every fetcher reuse the same connection pool.
+        
+        Returns:
+            Shared SocialData API client
+        """
+        with TweetFetcher._shared_client_lock:
+            if TweetFetcher._shared_client is None:
+                TweetFetcher._shared_client = SocialDataClient()
+            return TweetFetcher._shared_client
+    
     def fetch_user_info(self, username: str) -> Dict:
         """
         Fetch user information
@@ -41,7 +63,8 @@ class TweetFetcher:
                          max_tweets: int = 1000,
                          start_date: Optional[datetime] = None,
                          end_date: Optional[datetime] = None,
-                         progress_callback: Optional[Callable[[float, str, bool], None]] = None) -> List[Dict]:
+                         progress_callback: Optional[Callable[[float, str, bool], None]] = None,
+                         should_stop: Optional[Callable[[], bool]] = None) -> List[Dict]:
         """
         Fetch tweets for a user with filtering options
         
@@ -52,6 +75,7 @@ class TweetFetcher:
             start_date: Start date for tweet filtering
             end_date: End date for tweet filtering
             progress_callback: Callback for progress updates
+            should_stop: Optional callable checked before each page to stop early
             
         Returns:
             List of tweets
@@ -92,23 +116,44 @@ class TweetFetcher:
         # Two approaches: 
         # 1. For "both" or specific type with date filtering: use search endpoint
         # 2. For specific type without date filtering: use user tweets endpoint
+        if query:
+            fetch_page = partial(self.client.search_tweets, query)
+        else:
+            fetch_page = partial(self.client.get_user_tweets, user_id, include_replies=include_replies)
+        
+        all_tweets = self._collect_tweets(fetch_page, max_tweets, progress_callback, should_stop)
+        
+        self.logger.info(f"Tweet collection completed. Total tweets: {len(all_tweets)}")
+        return all_tweets
+    
+    def _collect_tweets(self, fetch_page: Callable[..., Dict], max_tweets: int,
+                        progress_callback: Optional[Callable[[float, str, bool], None]] = None,
+                        should_stop: Optional[Callable[[], bool]] = None) -> List[Dict]:
+        """
+        Follow pagination cursors and collect unique tweets
         
-        # Initialize variables
+        Args:
+            fetch_page: Callable taking a cursor keyword and returning a response page
+            max_tweets: Maximum number of tweets to collect
+            progress_callback: Callback for progress updates
+            should_stop: Optional callable checked before each page to stop early
+            
+        Returns:
+            List of tweets
+        """
         all_tweets = []
         seen_tweet_ids = set()
         cursor = None
         consecutive_errors = 0
+        progress_scale = 100.0 / max(max_tweets, 1)
         
         # Main fetch loop
         while len(all_tweets) < max_tweets:
+            if should_stop and should_stop():
+                break
+            
             try:
-                # Choose the right approach based on parameters
-                if query:
-                    # Search endpoint approach
-                    data = self.client.search_tweets(query, cursor=cursor)
-                else:
-                    # User tweets endpoint approach
-                    data = self.client.get_user_tweets(user_id, include_replies=include_replies, cursor=cursor)
+                data = fetch_page(cursor=cursor)
                 
                 # Get tweets from response
                 tweets = data.get('tweets', [])
@@ -137,7 +182,7 @@ class TweetFetcher:
                 
                 # Update progress
                 if progress_callback:
-                    progress = min(100, (len(all_tweets) / max_tweets) * 100)
+                    progress = min(100.0, len(all_tweets) * progress_scale)
                     status = f"Collected {len(all_tweets):,} tweets"
                     is_complete = not cursor or len(all_tweets) >= max_tweets
                     progress_callback(progress, status, is_complete)
@@ -154,10 +199,8 @@ class TweetFetcher:
                     break
                 
                 # Reset error counter on successful request
+                # (pacing between pages is handled by the client's rate limiter)
                 consecutive_errors = 0
-                
-                # Small delay between requests
-                time.sleep(0.5)
             
             except Exception as e:
                 consecutive_errors += 1
@@ -169,7 +212,6 @@ class TweetFetcher:
                 
                 time.sleep(2)  # Wait before retrying
         
-        self.logger.info(f"Tweet collection completed. Total tweets: {len(all_tweets)}")
         return all_tweets
     
     def count_user_tweets(self, username: str) -> Dict[str, int]:
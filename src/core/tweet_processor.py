@@ -3,13 +3,144 @@ Tweet Processor - Module for processing and tagging tweets
 """
 
 import re
+import heapq
 import logging
-from typing import Dict, List, Optional, Set, Any
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any
 from datetime import datetime
 from collections import Counter
-import string
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import re2  # Optional: google-re2 gives linear-time DFA matching for text cleaning
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick  # Optional: pyahocorasick finds all topics in one pass over the text
+except ImportError:
+    ahocorasick = None
+
+# Patterns used to clean tweet text, compiled once for all tweets.
+# URLs, a leading RT prefix, mentions and hashtags are removed in a single pass.
+if re2 is not None:
+    # RE2's \w and \s are ASCII-only, so spell out the Unicode word and whitespace
+    # characters (str.isalnum() and str.isspace()) to match the stdlib pattern
+    _CLEAN_RE = re2.compile(
+        r'https?://[^\s\x0b\x1c-\x1f\x85\pZ]+|^RT[\s\x0b\x1c-\x1f\x85\pZ]+|@[\pL\pN_]+|#[\pL\pN_]+'
+    )
+else:
+    _CLEAN_RE = re.compile(r'https?://\S+|^RT\s+|@\w+|#\w+')
+_WS_RE = re.compile(r'\s+')
+
+# Lowercase word tokens for lexicon matching
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Candidate topic words: 3+ word characters, allowing inner apostrophes (e.g. "don't")
+_TOPIC_WORD_RE = re.compile(r"\w[\w']+\w")
+
+
+def _topic_words(text: str, stop_words: Set[str]) -> List[str]:
+    """
+    Tokenize text into candidate topic words in a single pass
+    
+    Args:
+        text: Cleaned tweet text
+        stop_words: Words to exclude
+        
+    Returns:
+        Lowercased words of 3+ characters that are not stop words
+    """
+    return [word for word in _TOPIC_WORD_RE.findall(text.lower()) if word not in stop_words]
+
+
+def _analyze_sentiment_impl(text_lower: str) -> str:
+    """Rule-based sentiment label for a lowercased text (see TweetProcessor.analyze_sentiment)"""
+    if not text_lower:
+        return "neutral"
+    
+    # Tokenize once; the text is already lowercased for case-insensitive matching
+    tokens = set(_WORD_RE.findall(text_lower))
+    
+    # Count positive and negative words (whole words only, so "goodbye" is not "good")
+    positive_count = len(tokens & TweetProcessor.POSITIVE_WORDS)
+    negative_count = len(tokens & TweetProcessor.NEGATIVE_WORDS)
+    
+    # Determine sentiment based on counts
+    if positive_count > negative_count:
+        return "positive"
+    elif negative_count > positive_count:
+        return "negative"
+    else:
+        return "neutral"
+
+
+def _analyze_writing_style_impl(text: str) -> Tuple[str, ...]:
+    """Writing style labels for a text (see TweetProcessor.analyze_writing_style)"""
+    if not text:
+        return ("standard",)
+    
+    styles = []
+    words = text.split()
+    
+    # Check for questions, or a first word that is a question indicator
+    if '?' in text or (words and words[0].lower() in TweetProcessor.QUESTION_INDICATORS):
+        styles.append("question")
+    
+    # Check for exclamations
+    if '!' in text:
+        styles.append("exclamatory")
+    
+    # Check for ALL CAPS (shouting)
+    caps_words = sum(1 for word in words if word.isupper() and len(word) > 1)
+    if caps_words > len(words) / 3:  # If more than 1/3 of words are ALL CAPS
+        styles.append("emphatic")
+    
+    # Check for links/references
+    if 'https://' in text or 'http://' in text:
+        styles.append("reference")
+    
+    # Check for hashtags
+    if '#' in text:
+        styles.append("tagged")
+    
+    # Check for mentions
+    if '@' in text:
+        styles.append("conversational")
+    
+    # If no specific style detected, mark as standard
+    if not styles:
+        styles.append("standard")
+    
+    # Tuple so cached results cannot be mutated by callers
+    return tuple(styles)
+
+
+# Retweets and templated posts repeat the same text many times, so memoize per text.
+# Module-level (not lru_cache on the methods) so the cache does not hold on to instances.
+_analyze_sentiment_cached = lru_cache(maxsize=8192)(_analyze_sentiment_impl)
+_analyze_writing_style_cached = lru_cache(maxsize=8192)(_analyze_writing_style_impl)
+
+
+def _chunks(items: List[Dict], size: int) -> Iterator[List[Dict]]:
+    """Split a list into consecutive chunks of at most size items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _process_chunk(tweets: List[Dict]) -> List[Dict]:
+    """Process one chunk of tweets in a worker process"""
+    return TweetProcessor().process_tweets(tweets)
+
+
+def _tag_chunk(tweets: List[Dict], topics: List[str]) -> List[Dict]:
+    """Tag one chunk of tweets in a worker process"""
+    return TweetProcessor().tag_tweets(tweets, topics)
+
+
 class TweetProcessor:
     """Class for processing and tagging tweets"""
     
@@ -63,43 +194,73 @@ class TweetProcessor:
         'may', 'might', 'must', 'do', 'does', 'did', 'has', 'have', 'had'
     }
     
+    # Number of tweets handed to each worker process in parallel mode
+    PARALLEL_CHUNK_SIZE = 1000
+    
     def __init__(self):
         """Initialize the tweet processor"""
         self.logger = logging.getLogger(__name__)
     
-    def process_tweets(self, tweets: List[Dict]) -> List[Dict]:
+    def _map_chunks(self, func: Callable[..., List[Dict]], workers: int,
+                    *iterables: Iterable) -> List[Dict]:
+        """
+        Run func over chunks in a process pool and flatten the results in order
+        
+        Args:
+            func: Module-level (picklable) function returning a list per chunk
+            workers: Number of worker processes
+            iterables: Argument iterables passed to func, as with map()
+            
+        Returns:
+            Concatenated results
+        """
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_result in executor.map(func, *iterables):
+                results.extend(chunk_result)
+        return results
+    
+    def process_tweets(self, tweets: List[Dict], workers: Optional[int] = None) -> List[Dict]:
         """
         Process tweets to extract clean text and add metadata
         
         Args:
             tweets: List of raw tweet objects
+            workers: Number of worker processes for large batches (None or 1 = serial)
             
         Returns:
             List of processed tweet objects
         """
+        if workers and workers > 1 and len(tweets) > self.PARALLEL_CHUNK_SIZE:
+            processed_tweets = self._map_chunks(_process_chunk, workers,
+                                                _chunks(tweets, self.PARALLEL_CHUNK_SIZE))
+            self.logger.info(f"Processed {len(processed_tweets)} tweets using {workers} workers")
+            return processed_tweets
+        
         processed_tweets = []
+        clean_text = self._clean_tweet_text
         
         for tweet in tweets:
             try:
+                get = tweet.get
+                user = get('user', {})
+                
                 # Extract the full text and clean it
-                text = tweet.get('full_text') or tweet.get('text', '')
-                cleaned_text = self._clean_tweet_text(text)
+                text = get('full_text') or get('text', '')
                 
                 # Create a processed tweet object with the data we need
                 processed_tweet = {
-                    'tweet_id': tweet.get('id_str'),
-                    'created_at': tweet.get('tweet_created_at') or tweet.get('created_at'),
+                    'tweet_id': get('id_str'),
+                    'created_at': get('tweet_created_at') or get('created_at'),
                     'text': text,
-                    'cleaned_text': cleaned_text,
-                    'author': tweet.get('user', {}).get('screen_name'),
-                    'author_name': tweet.get('user', {}).get('name'),
-                    'retweets': tweet.get('retweet_count', 0),
-                    'likes': tweet.get('favorite_count', 0),
-                    'replies': tweet.get('reply_count', 0),
-                    'is_reply': tweet.get('in_reply_to_status_id_str') is not None,
-                    'is_retweet': tweet.get('retweeted_status') is not None,
-                    # Keep the original data
-                    'original_data': tweet
+                    'cleaned_text': clean_text(text),
+                    'author': user.get('screen_name'),
+                    'author_name': user.get('name'),
+                    'retweets': get('retweet_count', 0),
+                    'likes': get('favorite_count', 0),
+                    'replies': get('reply_count', 0),
+                    'is_reply': get('in_reply_to_status_id_str') is not None,
+                    'is_retweet': get('retweeted_status') is not None
                 }
                 
                 processed_tweets.append(processed_tweet)
@@ -123,22 +284,8 @@ class TweetProcessor:
         if not text:
             return ""
         
-        # Remove URLs
-        text = re.sub(r'https?://\S+', '', text)
-        
-        # Remove mentions (@username)
-        text = re.sub(r'@\w+', '', text)
-        
-        # Remove hashtags (#topic)
-        text = re.sub(r'#\w+', '', text)
-        
-        # Remove RT prefix
-        text = re.sub(r'^RT\s+', '', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        # Remove URLs, RT prefix, mentions and hashtags, then collapse whitespace
+        return _WS_RE.sub(' ', _CLEAN_RE.sub('', text)).strip()
     
     def extract_topics(self, tweets: List[Dict], min_count: int = 3, max_topics: int = 10) -> List[str]:
         """
@@ -152,58 +299,35 @@ class TweetProcessor:
         Returns:
             List of topic strings
         """
-        # Extract words from all tweets
-        all_words = []
+        # Count word frequencies tweet by tweet, without building one list of all words
+        word_counts = Counter()
         for tweet in tweets:
             cleaned_text = tweet.get('cleaned_text', '')
             if not cleaned_text:
                 continue
                 
-            # Tokenize into words
-            words = cleaned_text.lower().split()
-            
-            # Filter out stop words, short words, etc.
-            words = [word.strip(string.punctuation) for word in words]
-            words = [word for word in words if word and len(word) > 2 and word not in self.STOP_WORDS]
-            
-            all_words.extend(words)
+            # Tokenize into words, filtering out stop words, short words, etc.
+            word_counts.update(_topic_words(cleaned_text, self.STOP_WORDS))
         
-        # Count word frequencies
-        word_counts = Counter(all_words)
-        
-        # Filter words by minimum count and get the top N topics
-        topics = [word for word, count in word_counts.most_common(max_topics) if count >= min_count]
+        # Drop words below the minimum count first, then take the top N with a bounded heap
+        frequent = [(word, count) for word, count in word_counts.items() if count >= min_count]
+        topics = [word for word, _ in heapq.nlargest(max_topics, frequent, key=itemgetter(1))]
         
         self.logger.info(f"Extracted {len(topics)} topics: {', '.join(topics)}")
         return topics
     
-    def analyze_sentiment(self, text: str) -> str:
+    def analyze_sentiment(self, text: str, prelowered: bool = False) -> str:
         """
         Simple rule-based sentiment analysis
         
         Args:
             text: Tweet text
+            prelowered: Whether the text is already lowercased
             
         Returns:
             Sentiment label ("positive", "negative", or "neutral")
         """
-        if not text:
-            return "neutral"
-        
-        # Convert to lowercase for case-insensitive matching
-        text_lower = text.lower()
-        
-        # Count positive and negative words
-        positive_count = sum(1 for word in self.POSITIVE_WORDS if word in text_lower)
-        negative_count = sum(1 for word in self.NEGATIVE_WORDS if word in text_lower)
-        
-        # Determine sentiment based on counts
-        if positive_count > negative_count:
-            return "positive"
-        elif negative_count > positive_count:
-            return "negative"
-        else:
-            return "neutral"
+        return _analyze_sentiment_cached(text if prelowered else text.lower())
     
     def analyze_writing_style(self, text: str) -> List[str]:
         """
@@ -215,53 +339,50 @@ class TweetProcessor:
         Returns:
             List of style labels
         """
-        if not text:
-            return ["standard"]
-        
-        styles = []
-        
-        # Check for questions
-        if '?' in text:
-            styles.append("question")
-        elif any(word.lower() in self.QUESTION_INDICATORS for word in text.split()[:1]):
-            # Check if first word is a question indicator
-            styles.append("question")
-        
-        # Check for exclamations
-        if '!' in text:
-            styles.append("exclamatory")
-        
-        # Check for ALL CAPS (shouting)
-        words = text.split()
-        caps_words = sum(1 for word in words if word.isupper() and len(word) > 1)
-        if caps_words > len(words) / 3:  # If more than 1/3 of words are ALL CAPS
-            styles.append("emphatic")
-        
-        # Check for links/references
-        if 'https://' in text or 'http://' in text:
-            styles.append("reference")
-        
-        # Check for hashtags
-        if '#' in text:
-            styles.append("tagged")
-        
-        # Check for mentions
-        if '@' in text:
-            styles.append("conversational")
+        return list(_analyze_writing_style_cached(text))
+    
+    def _build_topic_matcher(self, topics: List[str]) -> Callable[[str], List[str]]:
+        """
+        Build a function that returns the topics contained in a text
         
-        # If no specific style detected, mark as standard
-        if not styles:
-            styles.append("standard")
+        Uses an Aho-Corasick automaton when pyahocorasick is installed, so each
+        text is scanned once regardless of the number of topics.
         
-        return styles
+        Args:
+            topics: List of topics to match (case-insensitive substrings)
+            
+        Returns:
+            Function mapping a lowercased text to its matching topics, in topic order
+        """
+        # Lowercase each topic once, not once per tweet
+        keys = [topic.lower() for topic in topics]
+        topics_lower = list(zip(topics, keys))
+        
+        if ahocorasick is None or not any(keys):
+            def match_topics(text_lower: str) -> List[str]:
+                return [topic for topic, key in topics_lower if key in text_lower]
+            return match_topics
+        
+        automaton = ahocorasick.Automaton()
+        for key in keys:
+            if key:
+                automaton.add_word(key, key)
+        automaton.make_automaton()
+        
+        def match_topics(text_lower: str) -> List[str]:
+            found = {key for _, key in automaton.iter(text_lower)}
+            return [topic for topic, key in topics_lower if not key or key in found]
+        return match_topics
     
-    def tag_tweets(self, tweets: List[Dict], topics: Optional[List[str]] = None) -> List[Dict]:
+    def tag_tweets(self, tweets: List[Dict], topics: Optional[List[str]] = None,
+                   workers: Optional[int] = None) -> List[Dict]:
         """
         Add tags (topic, sentiment, writing style) to tweets
         
         Args:
             tweets: List of processed tweet objects
             topics: Optional list of pre-extracted topics
+            workers: Number of worker processes for large batches (None or 1 = serial)
             
         Returns:
             List of tagged tweet objects
@@ -270,23 +391,26 @@ class TweetProcessor:
         if topics is None:
             topics = self.extract_topics(tweets)
         
+        if workers and workers > 1 and len(tweets) > self.PARALLEL_CHUNK_SIZE:
+            tagged_tweets = self._map_chunks(_tag_chunk, workers,
+                                             _chunks(tweets, self.PARALLEL_CHUNK_SIZE), repeat(topics))
+            self.logger.info(f"Tagged {len(tagged_tweets)} tweets using {workers} workers")
+            return tagged_tweets
+        
+        match_topics = self._build_topic_matcher(topics)
         tagged_tweets = []
         
         for tweet in tweets:
-            text = tweet.get('cleaned_text', '')
+            # Lowercase once for both topic matching and sentiment
+            text_lower = tweet.get('cleaned_text', '').lower()
             
             # Initialize tags
             tags = {
-                'topics': [],
-                'sentiment': self.analyze_sentiment(text),
+                'topics': match_topics(text_lower),
+                'sentiment': self.analyze_sentiment(text_lower, prelowered=True),
                 'style': self.analyze_writing_style(tweet.get('text', ''))
             }
             
-            # Add topic tags
-            for topic in topics:
-                if topic.lower() in text.lower():
-                    tags['topics'].append(topic)
-            
             # Add tags to the tweet object
             tweet_with_tags = {**tweet, 'tags': tags}
             tagged_tweets.append(tweet_with_tags)
@@ -3,35 +3,94 @@ SocialScope-Tweets Web UI - Flask Application
 """
 
 import os
+import re
 import sys
 import json
+import secrets
 import time
+import heapq
 import logging
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, send_from_directory
+from flask import (Flask, Response, abort, render_template, request, redirect, url_for, flash, jsonify,
+                   send_from_directory, stream_with_context)
+from flask.json.provider import DefaultJSONProvider
+import sqlite3
 import threading
 import queue
+from collections import OrderedDict, deque
+from concurrent.futures import Future, as_completed
 from werkzeug.exceptions import HTTPException
+from werkzeug.utils import safe_join
+import mimetypes
 import traceback
 
+try:
+    import orjson  # Optional: faster JSON for dashboard data files and API responses
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # Add project root to Python path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Import from the core project
-from src.core.socialdata_client import SocialDataClient
-from src.core.tweet_fetcher import TweetFetcher
-from src.core.tweet_processor import TweetProcessor
-from src.core.output_generator import OutputGenerator
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        # Options orjson has no equivalent for go through the standard encoder
+        if not kwargs.keys() <= {'indent', 'separators', 'sort_keys'}:
+            return super().dumps(obj, **kwargs)
+        
+        # Datetimes go through self.default so they keep Flask's HTTP date format;
+        # orjson output is always compact, so separators need no handling
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # e.g. non-string dict keys or integers beyond 64 bits
+            return super().dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
 
 # Initialize Flask app
 app = Flask(__name__)
-app.secret_key = os.urandom(24)
+# Set FLASK_SECRET_KEY to keep sessions valid across restarts and multiple workers
+app.secret_key = os.environ.get('FLASK_SECRET_KEY') or secrets.token_bytes(32)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Compile each template once and reuse it; only re-check template files in debug mode
+FLASK_DEBUG = os.getenv('FLASK_DEBUG', '0') == '1'
+app.config['TEMPLATES_AUTO_RELOAD'] = FLASK_DEBUG
+app.jinja_env.auto_reload = FLASK_DEBUG
+
+# Hand file downloads to the front-end server so it can sendfile(2) them instead of
+# streaming them through Python. Set X_ACCEL_REDIRECT_PREFIX to an nginx internal location
+# aliased to the output folder (e.g. /internal/output), or USE_X_SENDFILE=1 for Apache/lighttpd.
+X_ACCEL_REDIRECT_PREFIX = os.getenv('X_ACCEL_REDIRECT_PREFIX', '').rstrip('/')
+app.use_x_sendfile = os.getenv('USE_X_SENDFILE', '0') == '1'
+
+# Add the current date to all templates, refreshed at most once per second
+_now_cache = [float('-inf'), None]
 
-# Add the current date to all templates
 @app.context_processor
 def inject_now():
-    return {'now': datetime.now()}
+    tick = time.monotonic()
+    if tick - _now_cache[0] >= 1.0:
+        _now_cache[:] = [tick, datetime.now()]
+    return {'now': _now_cache[1]}
 
 # Configure logging
 logging.basicConfig(
@@ -44,34 +103,202 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class JobStore:
+    """
+    Finished job results, kept in SQLite instead of process memory
+    
+    Supports the dict operations the app uses on job results (``in``, ``[]``, ``get``, assignment),
+    so results survive server restarts and do not accumulate in memory. Recently read results
+    are cached in memory.
+    """
+    
+    def __init__(self, path, cache_size=64):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+        # Only hits are cached: a miss raises KeyError, which lru_cache does not store
+        self._load_cached = lru_cache(maxsize=cache_size)(self._load)
+    
+    def _connection(self):
+        """Open the database on first use (caller holds the lock)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, username TEXT, "
+                "tweet_count INTEGER, finished_at REAL NOT NULL, result TEXT NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+    
+    def _load(self, job_id):
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT result FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(job_id)
+        return _json_loads(row[0])
+    
+    def __getitem__(self, job_id):
+        return self._load_cached(job_id)
+    
+    def __setitem__(self, job_id, result):
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, status, username, tweet_count, finished_at, result) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, result['status'], result.get('username'), result.get('tweet_count'),
+                 time.time(), json.dumps(result))
+            )
+            conn.commit()
+        self._load_cached.cache_clear()
+    
+    def __contains__(self, job_id):
+        try:
+            self[job_id]
+        except KeyError:
+            return False
+        return True
+    
+    def get(self, job_id, default=None):
+        try:
+            return self[job_id]
+        except KeyError:
+            return default
+    
+    def completed_jobs(self):
+        """
+        Summary rows (job_id, username, tweet_count) of completed jobs, oldest first
+        """
+        with self._lock:
+            return self._connection().execute(
+                "SELECT job_id, username, tweet_count FROM jobs "
+                "WHERE status = 'completed' ORDER BY finished_at"
+            ).fetchall()
+
 # Global job tracking
 active_jobs = {}
-job_results = {}
-job_logs = {}
+# The store lives in the Flask instance folder, outside the output directory that /download serves
+job_results = JobStore(os.getenv('JOB_STORE_PATH', os.path.join(app.instance_path, 'jobs.sqlite3')))
+# Logs of the most recently started jobs; older ones are evicted as new jobs start
+job_logs = OrderedDict()
+job_logs_lock = threading.Lock()
+
+# Only the most recent log lines of each job, and the logs of the most recent jobs, are kept
+MAX_JOB_LOG_LINES = 500
+MAX_JOB_LOGS = int(os.getenv('MAX_JOB_LOGS', '64'))
+
+# Signalled whenever a job logs a line or finishes, to wake up the status event streams
+job_updates = threading.Condition()
+job_update_seq = 0
+
+# Seconds between keep-alive comments on an idle status event stream
+STREAM_KEEPALIVE = 15
+
+def notify_job_update():
+    """Wake up every status stream waiting for job progress"""
+    global job_update_seq
+    with job_updates:
+        job_update_seq += 1
+        job_updates.notify_all()
+
+# Bounded job queue: at most MAX_CONCURRENT_JOBS analyses run at once, the rest wait their turn,
+# and new submissions are turned away once MAX_PENDING_JOBS are queued or running.
+# Jobs stay in daemon threads so they share the API rate limiter and the in-memory job state
+# above, and an in-flight analysis never holds up server shutdown.
+MAX_CONCURRENT_JOBS = int(os.getenv('MAX_CONCURRENT_JOBS', '4'))
+MAX_PENDING_JOBS = int(os.getenv('MAX_PENDING_JOBS', '16'))
+job_slots = threading.BoundedSemaphore(MAX_CONCURRENT_JOBS)
+job_queue_lock = threading.Lock()
+
+def submit_io(func, *args, **kwargs):
+    """
+    Run an I/O leg of a job (API calls, file writes) on its own daemon thread
+    
+    Job threads keep the Python-heavy processing and hand these off, since they release the
+    GIL while they wait. Unlike ThreadPoolExecutor workers, which are joined at interpreter
+    exit, daemon threads let the server shut down in the middle of a long tweet fetch.
+    Each job runs at most four of these at once, so MAX_CONCURRENT_JOBS still bounds them.
+    
+    Returns:
+        A Future for the call's result
+    """
+    future = Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+    
+    threading.Thread(target=run, name='analysis-io', daemon=True).start()
+    return future
+
+def run_queued_job(*args):
+    """Wait for a free job slot, then run the analysis job"""
+    with job_slots:
+        run_analysis_job(*args)
 
 def run_analysis_job(job_id, username, tweet_type, max_tweets, start_date, end_date):
     """Run analysis job in background thread with improved error handling"""
+    # Set when the job ends, so a background tweet fetch stops at its next page
+    # instead of spending API credits on a job that already failed
+    stop_fetch = threading.Event()
     try:
-        job_logs[job_id] = []
+        with job_logs_lock:
+            job_log = job_logs[job_id] = deque(maxlen=MAX_JOB_LOG_LINES)
+            # Drop the logs of the oldest job
+            if len(job_logs) > MAX_JOB_LOGS:
+                job_logs.popitem(last=False)
         
         def log_message(message):
             """Add message to job logs"""
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            job_logs[job_id].append(f"[{timestamp}] {message}")
-            logger.info(f"Job {job_id}: {message}")
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            job_log.append(f"[{timestamp}] {message}")
+            # Let the logging handler format the record, only if INFO is enabled
+            logger.info("Job %s: %s", job_id, message)
+            notify_job_update()
         
+        if job_id in active_jobs:
+            active_jobs[job_id]['status'] = 'running'
         log_message(f"Starting analysis for @{username}")
         
         # Initialize components with better error handling
         try:
-            client = SocialDataClient()
-            fetcher = TweetFetcher(client)
+            # Import from the core project on first use, so web workers start without
+            # loading the HTTP client and text analysis dependencies
+            from src.core.tweet_fetcher import TweetFetcher
+            from src.core.tweet_processor import TweetProcessor
+            from src.core.output_generator import OutputGenerator
+            
+            fetcher = TweetFetcher()
             processor = TweetProcessor()
             output_gen = OutputGenerator("output")
         except Exception as e:
             log_message(f"Error initializing components: {str(e)}")
             raise
             
+        # Start fetching tweets in the background; it does not depend on the account info
+        tweets_future = submit_io(
+            fetcher.fetch_user_tweets,
+            username,
+            tweet_type=tweet_type,
+            max_tweets=max_tweets,
+            start_date=start_date,
+            end_date=end_date,
+            should_stop=stop_fetch.is_set
+        )
+        
         # Step 1: Fetch account info
         log_message(f"Fetching account info for @{username}")
         try:
@@ -99,16 +326,10 @@ def run_analysis_job(job_id, username, tweet_type, max_tweets, start_date, end_d
             log_message(f"Error saving account info: {str(e)}")
             raise
         
-        # Step 4: Fetch tweets with progress updates
+        # Step 4: Wait for the tweets fetched in the background
         log_message(f"Fetching tweets for @{username}")
         try:
-            tweets = fetcher.fetch_user_tweets(
-                username,
-                tweet_type=tweet_type,
-                max_tweets=max_tweets,
-                start_date=start_date,
-                end_date=end_date
-            )
+            tweets = tweets_future.result()
             log_message(f"Fetched {len(tweets)} tweets")
         except Exception as e:
             log_message(f"Error fetching tweets: {str(e)}")
@@ -139,68 +360,45 @@ def run_analysis_job(job_id, username, tweet_type, max_tweets, start_date, end_d
             log_message(f"Error tagging tweets: {str(e)}")
             raise
         
-        # Step 8: Save to different formats
+        # Step 8: Save to different formats, writing the files concurrently
         log_message("Saving tweets to output formats...")
         
-        csv_simple = ""
-        csv_analysis = ""
-        xml_file = ""
-        summary_file = ""
-        
-        # Save simple CSV
-        try:
-            csv_simple = output_gen.save_tweets_to_csv(tagged_tweets, output_folder, simple=True)
-            log_message(f"Saved simple CSV: {os.path.basename(csv_simple)}")
-        except Exception as e:
-            log_message(f"Error saving simple CSV: {str(e)}")
-            # Continue with other formats
-        
-        # Save analysis CSV
-        try:
-            csv_analysis = output_gen.save_tweets_to_csv(tagged_tweets, output_folder, simple=False)
-            log_message(f"Saved analysis CSV: {os.path.basename(csv_analysis)}")
-        except Exception as e:
-            log_message(f"Error saving analysis CSV: {str(e)}")
-        
-        # Save lean XML with style analysis
-        try:
-            xml_file = output_gen.save_tweets_to_xml(tagged_tweets, output_folder, account_info)
-            log_message(f"Saved XML: {os.path.basename(xml_file)}")
-        except Exception as e:
-            log_message(f"Error saving XML: {str(e)}")
-        
-        # Generate human-readable summary text
-        try:
-            summary_file = output_gen.save_summary_text(tagged_tweets, output_folder, account_info)
-            log_message(f"Saved summary: {os.path.basename(summary_file)}")
-        except Exception as e:
-            log_message(f"Error saving summary: {str(e)}")
-        
-        # Step 9: Prepare result data for display
-        summary_content = ""
+        writers = {
+            submit_io(output_gen.save_tweets_to_csv, tagged_tweets, output_folder, simple=True):
+                ('csv_simple', "simple CSV"),
+            submit_io(output_gen.save_tweets_to_csv, tagged_tweets, output_folder, simple=False):
+                ('csv_analysis', "analysis CSV"),
+            # Lean XML with style analysis
+            submit_io(output_gen.save_tweets_to_xml, tagged_tweets, output_folder, account_info):
+                ('xml', "XML"),
+            # Human-readable summary text
+            submit_io(output_gen.save_summary_text, tagged_tweets, output_folder, account_info):
+                ('summary', "summary"),
+        }
         
-        if summary_file:
+        saved_files = {}
+        # File names for the results page, worked out once per file
+        file_names = dict.fromkeys(('csv_simple', 'csv_analysis', 'xml', 'summary'), "")
+        for future in as_completed(writers):
+            key, label = writers[future]
             try:
-                with open(summary_file, 'r', encoding='utf-8') as f:
-                    summary_content = f.read()
+                saved_files[key] = future.result()
+                if saved_files[key]:
+                    file_names[key] = Path(saved_files[key]).name
+                log_message(f"Saved {label}: {file_names[key]}")
             except Exception as e:
-                log_message(f"Error reading summary file: {str(e)}")
+                log_message(f"Error saving {label}: {str(e)}")
+                # Continue with other formats
         
-        # Store results
+        # Step 9: Store results; the summary text stays on disk and is read when displayed
         job_results[job_id] = {
             'status': 'completed',
             'username': username,
             'tweet_count': len(tweets),
             'output_folder': str(output_folder),
             'relative_path': relative_output_path,
-            'files': {
-                'csv_simple': os.path.basename(csv_simple) if csv_simple else "",
-                'csv_analysis': os.path.basename(csv_analysis) if csv_analysis else "",
-                'xml': os.path.basename(xml_file) if xml_file else "",
-                'summary': os.path.basename(summary_file) if summary_file else "",
-                'account_info': "account_info.json"
-            },
-            'summary_content': summary_content,
+            'files': {**file_names, 'account_info': "account_info.json"},
+            'summary_file': saved_files.get('summary', ""),
             'account_info': {
                 'name': account_info.get('name', ''),
                 'screen_name': account_info.get('screen_name', ''),
@@ -222,12 +420,31 @@ def run_analysis_job(job_id, username, tweet_type, max_tweets, start_date, end_d
             'error_details': error_details
         }
         if job_id in job_logs:
-            job_logs[job_id].append(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: {str(e)}")
+            job_logs[job_id].append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] ERROR: {str(e)}")
     
     finally:
+        stop_fetch.set()
         # Remove from active jobs
         if job_id in active_jobs:
             del active_jobs[job_id]
+        notify_job_update()
+
+# Accepted formats for the analysis form fields
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+_USERNAME_RE = re.compile(r'[A-Za-z0-9_]{1,15}')
+
+def parse_form_date(value):
+    """
+    Parse a YYYY-MM-DD form date, returning None if it is malformed or not a real date
+    """
+    match = _DATE_RE.fullmatch(value)
+    if match is None:
+        return None
+    try:
+        return datetime(int(match[1]), int(match[2]), int(match[3]))
+    except ValueError:
+        # Well-formed but out of range, e.g. month 13 or February 30
+        return None
 
 @app.route('/')
 def index():
@@ -246,6 +463,11 @@ def analyze():
     if username.startswith('@'):
         username = username[1:]
     
+    # Twitter handles are 1-15 letters, digits or underscores
+    if not _USERNAME_RE.fullmatch(username):
+        flash("Please enter a valid Twitter username", "error")
+        return redirect(url_for('index'))
+    
     # Get job parameters
     tweet_type = request.form.get('tweet_type', 'both')
     max_tweets = int(request.form.get('max_tweets', 1000))
@@ -258,40 +480,45 @@ def analyze():
     end_date_str = request.form.get('end_date', '')
     
     if start_date_str:
-        try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-        except ValueError:
+        start_date = parse_form_date(start_date_str)
+        if start_date is None:
             flash("Invalid start date format. Please use YYYY-MM-DD", "error")
             return redirect(url_for('index'))
     
     if end_date_str:
-        try:
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
-        except ValueError:
+        end_date = parse_form_date(end_date_str)
+        if end_date is None:
             flash("Invalid end date format. Please use YYYY-MM-DD", "error")
             return redirect(url_for('index'))
     
     # Create a job ID
     job_id = f"{username}_{int(time.time())}"
     
-    # Start job in a separate thread
-    job_thread = threading.Thread(
-        target=run_analysis_job,
+    with job_queue_lock:
+        if len(active_jobs) >= MAX_PENDING_JOBS:
+            flash("Too many analyses are in progress. Please try again in a few minutes", "error")
+            return redirect(url_for('index'))
+        
+        active_jobs[job_id] = {
+            'start_time': datetime.now(),
+            'username': username,
+            'status': 'queued'
+        }
+    
+    # Queue the job; it starts as soon as a job slot is free
+    thread = threading.Thread(
+        target=run_queued_job,
         args=(job_id, username, tweet_type, max_tweets, start_date, end_date),
         daemon=True
     )
-    
-    active_jobs[job_id] = {
-        'start_time': datetime.now(),
-        'username': username,
-        'status': 'running'
-    }
-    
-    job_thread.start()
+    thread.start()
     
     # Redirect to job status page
     return redirect(url_for('job_status', job_id=job_id))
 
+# Shared stand-in for tweets without tags (never mutated)
+_EMPTY = {}
+
 # Utility function for dashboard data preparation
 def prepare_dashboard_data(tweets, account_info):
     """
@@ -300,62 +527,67 @@ def prepare_dashboard_data(tweets, account_info):
     if not tweets:
         return {}
     
-    # Extract basic metrics
     tweet_count = len(tweets)
-    reply_count = sum(1 for t in tweets if t.get('in_reply_to_status_id_str') is not None)
-    retweet_count = sum(1 for t in tweets if t.get('retweeted_status') is not None)
-    
-    # Calculate percentages
-    reply_percentage = (reply_count / tweet_count) * 100 if tweet_count > 0 else 0
-    retweet_percentage = (retweet_count / tweet_count) * 100 if tweet_count > 0 else 0
-    
-    # Calculate engagement metrics
-    total_likes = sum(t.get('favorite_count', 0) or 0 for t in tweets)
-    total_retweets = sum(t.get('retweet_count', 0) or 0 for t in tweets)
-    total_replies = sum(t.get('reply_count', 0) or 0 for t in tweets)
+    reply_count = 0
+    retweet_count = 0
+    total_likes = 0
+    total_retweets = 0
+    total_replies = 0
     
-    avg_likes = total_likes / tweet_count if tweet_count > 0 else 0
-    avg_retweets = total_retweets / tweet_count if tweet_count > 0 else 0
-    avg_replies = total_replies / tweet_count if tweet_count > 0 else 0
+    # Single pass: accumulate the metrics and score every original tweet for the table
+    candidates = []
+    for index, tweet in enumerate(tweets):
+        get = tweet.get
+        likes = get('favorite_count', 0) or 0
+        retweets = get('retweet_count', 0) or 0
+        replies = get('reply_count', 0) or 0
+        retweeted_status = get('retweeted_status')
+        
+        total_likes += likes
+        total_retweets += retweets
+        total_replies += replies
+        reply_count += get('in_reply_to_status_id_str') is not None
+        retweet_count += retweeted_status is not None
+        
+        # Skip retweets as they don't have as much analytical value
+        if not retweeted_status:
+            # Engagement score: likes + 2x retweets + 3x replies
+            candidates.append((likes + (retweets * 2) + (replies * 3), index))
     
-    # Prepare simplified tweet list for table view
+    # Simplified tweet list for table view: the 100 highest-engagement tweets,
+    # selected with a bounded heap instead of sorting every candidate
     dashboard_tweets = []
-    for tweet in tweets[:100]:  # Limit to latest 100 tweets for performance
-        # Skip retweets as they don't have as much analytical value
-        if tweet.get('retweeted_status'):
-            continue
-            
-        created_at = tweet.get('tweet_created_at', '') or tweet.get('created_at', '')
-        text = tweet.get('full_text', '') or tweet.get('text', '')
-        
-        # Calculate engagement score
-        engagement = (tweet.get('favorite_count', 0) or 0) + \
-                    ((tweet.get('retweet_count', 0) or 0) * 2) + \
-                    ((tweet.get('reply_count', 0) or 0) * 3)
+    for engagement, index in heapq.nlargest(100, candidates, key=itemgetter(0)):
+        get = tweets[index].get
+        created_at = get('tweet_created_at', '') or get('created_at', '')
+        text = get('full_text', '') or get('text', '')
         
         # Determine sentiment (this would come from your analysis)
         # In a real implementation, this would be from your processing pipeline
-        sentiment = "neutral"
-        if 'sentiment' in tweet.get('tags', {}):
-            sentiment = tweet.get('tags', {}).get('sentiment')
+        tags = get('tags') or _EMPTY
+        sentiment = tags.get('sentiment', "neutral")
             
         # Extract topics
-        topics = []
-        if 'topics' in tweet.get('tags', {}):
-            topics = tweet.get('tags', {}).get('topics', [])
+        topics = tags.get('topics', [])
         
         dashboard_tweets.append({
-            'id': tweet.get('id_str', ''),
+            'id': get('id_str', ''),
             'created_at': created_at,
             'text': text,
             'engagement': engagement,
             'sentiment': sentiment,
             'topics': topics,
-            'is_reply': tweet.get('in_reply_to_status_id_str') is not None
+            'is_reply': get('in_reply_to_status_id_str') is not None
         })
     
-    # Sort by engagement for high-impact tweets
-    dashboard_tweets.sort(key=lambda x: x['engagement'], reverse=True)
+    # Calculate percentages
+    reply_percentage = (reply_count / tweet_count) * 100 if tweet_count > 0 else 0
+    retweet_percentage = (retweet_count / tweet_count) * 100 if tweet_count > 0 else 0
+    
+    # Calculate engagement averages
+    avg_likes = total_likes / tweet_count if tweet_count > 0 else 0
+    avg_retweets = total_retweets / tweet_count if tweet_count > 0 else 0
+    avg_replies = total_replies / tweet_count if tweet_count > 0 else 0
     
     return {
         'metrics': {
@@ -377,6 +609,39 @@ def prepare_dashboard_data(tweets, account_info):
         }
     }
 
+# Parsed dashboard data of the most recently viewed jobs, with the file mtime it was read at
+DASHBOARD_CACHE_SIZE = 32
+_dashboard_cache = OrderedDict()
+_dashboard_cache_lock = threading.Lock()
+
+def load_dashboard_data(job_id, output_folder):
+    """
+    Load a job's dashboard data, reusing the parsed copy while the file is unchanged
+    """
+    path = os.path.join(output_folder, 'dashboard_data.json')
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        with _dashboard_cache_lock:
+            cached = _dashboard_cache.get(job_id)
+            if cached is not None and cached[0] == mtime:
+                _dashboard_cache.move_to_end(job_id)
+                return cached[1]
+        
+        with open(path, 'rb') as f:
+            dashboard_data = _json_loads(f.read())
+    except (FileNotFoundError, json.JSONDecodeError):
+        # If dashboard data doesn't exist, we'll use the data we have
+        logger.info("Dashboard data not found, using available data")
+        return {}
+    
+    with _dashboard_cache_lock:
+        _dashboard_cache[job_id] = (mtime, dashboard_data)
+        _dashboard_cache.move_to_end(job_id)
+        # Evict the least recently viewed job
+        if len(_dashboard_cache) > DASHBOARD_CACHE_SIZE:
+            _dashboard_cache.popitem(last=False)
+    return dashboard_data
+
 @app.route('/job/<job_id>')
 def job_status(job_id):
     """Show job status page"""
@@ -388,7 +653,8 @@ def job_status(job_id):
     # If job is complete, show results
     if job_id in job_results:
         result = job_results[job_id]
-        logs = job_logs.get(job_id, [])
+        # Snapshot the log deque so a still-logging job cannot mutate it mid-render
+        logs = list(job_logs.get(job_id, ()))
         
         # If it was successful, render the results template with dashboard data
         if result['status'] == 'completed':
@@ -396,19 +662,22 @@ def job_status(job_id):
             output_folder = result['output_folder']
             
             # Load tweet data if available (for interactive dashboard)
-            dashboard_data = {}
-            try:
-                with open(os.path.join(output_folder, 'dashboard_data.json'), 'r', encoding='utf-8') as f:
-                    dashboard_data = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                # If dashboard data doesn't exist, we'll use the data we have
-                logger.info("Dashboard data not found, using available data")
-                dashboard_data = {}
+            dashboard_data = load_dashboard_data(job_id, output_folder)
+            
+            # Read the summary text for this page view only
+            summary_content = ""
+            if result.get('summary_file'):
+                try:
+                    with open(result['summary_file'], 'r', encoding='utf-8') as f:
+                        summary_content = f.read()
+                except OSError as e:
+                    logger.error(f"Error reading summary file for job {job_id}: {str(e)}")
             
             return render_template('results.html', 
                                 result=result, 
                                 logs=logs, 
                                 job_id=job_id,
+                                summary_content=summary_content,
                                 dashboard_data=dashboard_data)
         
         # If job failed, show error page
@@ -420,11 +689,12 @@ def job_status(job_id):
                                 job_id=job_id)
     
     # If job is still running, show status page
-    return render_template('job_status.html', job_id=job_id, logs=job_logs.get(job_id, []), error=False)
+    return render_template('job_status.html', job_id=job_id, logs=list(job_logs.get(job_id, ())), error=False)
 
-@app.route('/api/job_status/<job_id>')
-def api_job_status(job_id):
-    """API endpoint to get job status for AJAX polling"""
+def job_status_payload(job_id):
+    """
+    Current status, message and last 10 log lines of a job
+    """
     status = "not_found"
     progress = 0
     message = "Job not found"
@@ -436,18 +706,69 @@ def api_job_status(job_id):
         status = job_results[job_id]['status']
         message = "Analysis complete" if status == "completed" else job_results[job_id].get('error_message', 'Analysis failed')
     
-    logs = job_logs.get(job_id, [])
+    logs = list(job_logs.get(job_id, ()))
     
-    return jsonify({
+    return {
         "status": status,
         "message": message,
-        "logs": logs[-10:] if logs else []  # Return last 10 logs
-    })
+        "logs": logs[-10:]  # Return last 10 logs
+    }
+
+@app.route('/api/job_status/<job_id>')
+def api_job_status(job_id):
+    """API endpoint to get job status for AJAX polling"""
+    return jsonify(job_status_payload(job_id))
+
+@app.route('/stream/<job_id>')
+def stream_job_status(job_id):
+    """Server-Sent Events stream of job status, pushed whenever the job makes progress"""
+    def generate():
+        last_payload = None
+        while True:
+            with job_updates:
+                seen_seq = job_update_seq
+            
+            payload = job_status_payload(job_id)
+            if payload != last_payload:
+                yield f"data: {app.json.dumps(payload)}\n\n"
+                last_payload = payload
+            else:
+                # Comment line keeps proxies from timing out the idle connection
+                yield ": keepalive\n\n"
+            
+            if payload['status'] != 'running':
+                return
+            
+            # Sleep until the next log line or status change
+            with job_updates:
+                job_updates.wait_for(lambda: job_update_seq != seen_seq, timeout=STREAM_KEEPALIVE)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 @app.route('/download/<path:job_path>/<filename>')
 def download_file(job_path, filename):
     """Download a result file"""
     directory = os.path.join('output', job_path)
+    
+    if X_ACCEL_REDIRECT_PREFIX:
+        file_path = safe_join('output', job_path, filename)
+        if file_path is None or not os.path.isfile(file_path):
+            abort(404)
+        
+        # nginx serves the body from its internal location; we only send the headers
+        internal_path = os.path.relpath(file_path, 'output').replace(os.sep, '/')
+        return Response(
+            mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream',
+            headers={
+                'X-Accel-Redirect': f"{X_ACCEL_REDIRECT_PREFIX}/{internal_path}",
+                'Content-Disposition': f'attachment; filename="{os.path.basename(file_path)}"'
+            }
+        )
+    
     return send_from_directory(directory, filename, as_attachment=True)
 
 @app.route('/jobs')
@@ -455,14 +776,13 @@ def list_jobs():
     """List all completed jobs"""
     completed_jobs = []
     
-    for job_id, result in job_results.items():
-        if result['status'] == 'completed':
-            completed_jobs.append({
-                'job_id': job_id,
-                'username': result['username'],
-                'tweet_count': result['tweet_count'],
-                'date': job_id.split('_')[-1]  # Extract timestamp from job ID
-            })
+    for job_id, username, tweet_count in job_results.completed_jobs():
+        completed_jobs.append({
+            'job_id': job_id,
+            'username': username,
+            'tweet_count': tweet_count,
+            'date': job_id.split('_')[-1]  # Extract timestamp from job ID
+        })
     
     return render_template('jobs.html', jobs=completed_jobs)
 
@@ -527,4 +847,4 @@ if __name__ == '__main__':
     # Make sure output directory exists
     os.makedirs('output', exist_ok=True)
     # Run Flask app
-    app.run(debug=True, host='0.0.0.0', port=8000)
\ No newline at end of file
+    app.run(debug=FLASK_DEBUG, host='0.0.0.0', port=8000)
\ No newline at end of file